@@ -1,5 +1,11 @@
-import os, time, requests, importlib, queue, threading
+import os, re, json, time, uuid, sqlite3, requests, importlib, queue, threading
+from collections import deque, OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import asyncio, hashlib
 import gradio as gr
+import httpx
+import numpy as np
 
 ORCHESTRATOR = os.getenv("ORCHESTRATOR_URL", "http://localhost:8000")
 
@@ -37,15 +43,416 @@ def unload_whisper():
         return "✓ Whisper unloaded"
     return "Whisper not loaded"
 
-def call_core(messages, provider="grok"):
-    """Call orchestrator API"""
+# ===== CONTEXT COMPACTION =====
+
+CHARS_PER_TOKEN = 4
+PHASE_TOKEN_BUDGETS = {
+    "architect": int(os.getenv("ARCHITECT_TOKEN_BUDGET", "2000")),
+    "engineer": int(os.getenv("ENGINEER_TOKEN_BUDGET", "3000")),
+    "parser": int(os.getenv("PARSER_TOKEN_BUDGET", "1500")),
+}
+PREFILL_TOKENS_PER_SEC = float(os.getenv("PREFILL_TOKENS_PER_SEC", "1500"))
+_FILE_LIKE = re.compile(r"[\w./-]{1,255}\.\w{1,5}\b")  # bounded run: no quadratic backtracking
+TIER_SCAN_CHARS = 500  # classify lines by their start; base64/minified lines are never scanned whole
+_PINNED_LINE = re.compile(r"^\s*Voice input:")  # always kept by summarize_text (truncated if huge)
+
+def estimate_tokens(text):
+    """Cheap local token estimate (~4 chars/token)"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def dedupe_text(text):
+    """Drop repeated multi-line prose paragraphs, keeping first occurrences.
+
+    Single lines and anything inside a ``` fence are never touched: an import
+    or signature that repeats across files is content, not noise.
+    """
+    parts = re.split(r"(\n\s*\n)", text)  # paragraphs at even indices, separators at odd
+    seen, out, in_code = set(), [], False
+    for i in range(0, len(parts), 2):
+        para = parts[i]
+        fenced = in_code or "```" in para
+        in_code ^= para.count("```") % 2 == 1
+        key = para.strip()
+        if not fenced and "\n" in key:
+            if key in seen:
+                continue
+            seen.add(key)
+        if out:
+            out.append(parts[i - 1])
+        out.append(para)
+    return "".join(out)
+
+@lru_cache(maxsize=256)
+def summarize_text(text, budget):
+    """Extractive summary within a token budget: pinned lines, headings, file paths, bullets, then prose.
+
+    A line that does not fit the remaining budget is truncated rather than
+    dropped, so one oversized line cannot wipe out the whole message.
+    """
+    lines = text.splitlines()
+
+    def tier(line):
+        s = line[:TIER_SCAN_CHARS].strip()
+        if _PINNED_LINE.match(s):
+            return 0
+        if s.startswith("#"):
+            return 1
+        if _FILE_LIKE.search(s):
+            return 2
+        if s[:1] in "-*•" or s[:2].rstrip(".").isdigit():
+            return 3
+        return 4
+
+    tiers = [tier(line) if line.strip() else None for line in lines]
+    keep, used = {}, 0
+    for t in range(5):
+        for i, line in enumerate(lines):
+            if tiers[i] != t:
+                continue
+            cost = estimate_tokens(line) + 1
+            remaining = budget - used
+            if cost <= remaining:
+                keep[i] = line
+                used += cost
+            elif remaining >= 8 or t == 0:
+                chars = max(remaining - 2, 8) * CHARS_PER_TOKEN
+                keep[i] = line[:chars] + " […]"
+                used += estimate_tokens(keep[i]) + 1
+    summary = "\n".join(keep[i] for i in sorted(keep))
+    dropped = sum(1 for i, line in enumerate(lines) if line.strip() and keep.get(i) != line)
+    return summary + (f"\n[... {dropped} lines compacted ...]" if dropped else "")
+
+def compact_messages(messages, phase):
+    """Only over the phase budget: dedupe, then if still over, summarize the largest non-system message"""
+    start = time.time()
+    budget = PHASE_TOKEN_BUDGETS.get(phase)
+    before = total = sum(estimate_tokens(m["content"]) for m in messages)
+    hits = summarize_text.cache_info().hits
+    out = messages
+    if budget and total > budget:
+        out = [m if m["role"] == "system" else {**m, "content": dedupe_text(m["content"])} for m in messages]
+        total = sum(estimate_tokens(m["content"]) for m in out)
+    summarized = False
+    if budget and total > budget:
+        idx = max((i for i, m in enumerate(out) if m["role"] != "system"),
+                  key=lambda i: len(out[i]["content"]), default=None)
+        if idx is not None:
+            rest = total - estimate_tokens(out[idx]["content"])
+            out[idx] = {**out[idx], "content": summarize_text(out[idx]["content"], max(budget - rest, 64))}
+            summarized = True
+    after = sum(estimate_tokens(m["content"]) for m in out)
+    return out, {
+        "phase": phase,
+        "tokens_before": before,
+        "tokens_after": after,
+        "summarized": summarized,
+        "summary_cache_hit": summarize_text.cache_info().hits > hits,
+        "overhead_ms": round((time.time() - start) * 1000, 2),
+    }
+
+class CompactionLedger:
+    """Per-run token/latency savings from context compaction"""
+    def __init__(self, keep=20):
+        self.runs = deque(maxlen=keep)
+        self.lock = threading.Lock()
+
+    def begin_run(self, label):
+        run = {"run": label[:60], "started": time.strftime("%H:%M:%S"), "phases": []}
+        with self.lock:
+            self.runs.append(run)
+        return run
+
+    def record(self, run, stats):
+        if run is not None:
+            with self.lock:
+                run["phases"].append(stats)
+
+    def report(self):
+        with self.lock:
+            runs = [dict(r) for r in self.runs]
+        for r in runs:
+            saved = sum(p["tokens_before"] - p["tokens_after"] for p in r["phases"])
+            overhead = sum(p["overhead_ms"] for p in r["phases"]) / 1000
+            r["tokens_saved"] = saved
+            r["est_latency_saved_s"] = round(saved / PREFILL_TOKENS_PER_SEC - overhead, 3)
+        return {
+            "total_tokens_saved": sum(r["tokens_saved"] for r in runs),
+            "total_est_latency_saved_s": round(sum(r["est_latency_saved_s"] for r in runs), 3),
+            "latency_note": f"Estimated, not measured: tokens saved / PREFILL_TOKENS_PER_SEC "
+                            f"({PREFILL_TOKENS_PER_SEC:g} tok/s) minus compaction overhead",
+            "runs": runs[::-1],
+        }
+
+compaction = CompactionLedger()
+
+def studio_savings():
+    """Studio-side savings shown on the Cost Dashboard"""
+    return {"semantic_cache": vision_cache.stats(), "context_compaction": compaction.report(),
+            "camera_jobs": camera_jobs.stats()}
+
+# ===== SEMANTIC VISION CACHE =====
+
+EMBED_DIM = 1024
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))  # reuse prior build
+SEMANTIC_SEED_THRESHOLD = float(os.getenv("SEMANTIC_SEED_THRESHOLD", "0.70"))  # seed architect with it
+EMBED_STOPWORDS = {"a", "an", "the", "in", "with", "for", "and", "of", "to", "on", "using",
+                   "app", "build", "create", "make", "me", "please", "i", "want", "need"}
+
+def embed_text(text, dim=EMBED_DIM):
+    """Signed hashing vectorizer over content words and char trigrams (L2-normalized)"""
+    words = [w for w in re.findall(r"\w+", text.lower()) if w not in EMBED_STOPWORDS]
+    feats = words + [f"#{w[i:i + 3]}" for w in words for i in range(max(1, len(w) - 2))]
+    vec = np.zeros(dim, dtype=np.float32)
+    for f in feats:
+        h = int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "little")
+        vec[h % dim] += 1.0 if h >> 63 else -1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+class SemanticCache:
+    """Fixed-capacity nearest-neighbour index of past visions and their builds"""
+    def __init__(self, dim=EMBED_DIM, capacity=512):
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.entries = []
+        self.capacity = capacity
+        self.next_slot = 0
+        self.lock = threading.Lock()
+        self.counts = {"hit": 0, "seed": 0, "miss": 0}
+        self.latency_saved = 0.0
+
+    def lookup(self, text):
+        """Return (entry, cosine similarity) of the nearest prior vision"""
+        query = embed_text(text)
+        with self.lock:
+            if not self.entries:
+                return None, 0.0
+            sims = self.vectors[:len(self.entries)] @ query
+            i = int(np.argmax(sims))
+            return self.entries[i], float(sims[i])
+
+    def classify(self, text):
+        """Look up a vision and count it as a hit, seed or miss"""
+        entry, score = self.lookup(text)
+        kind = "hit" if score >= SEMANTIC_CACHE_THRESHOLD else "seed" if score >= SEMANTIC_SEED_THRESHOLD else "miss"
+        with self.lock:
+            self.counts[kind] += 1
+            if kind == "hit":
+                self.latency_saved += entry["elapsed_s"]
+        return kind, entry, score
+
+    def add(self, text, design, code, elapsed):
+        """Store a build; one that would hit an existing entry replaces it (e.g. after a regenerate)"""
+        vec = embed_text(text)
+        entry = {"vision": text, "design": design, "code": code, "elapsed_s": round(elapsed, 2)}
+        with self.lock:
+            if self.entries:
+                sims = self.vectors[:len(self.entries)] @ vec
+                i = int(np.argmax(sims))
+                if sims[i] >= SEMANTIC_CACHE_THRESHOLD:
+                    self.vectors[i], self.entries[i] = vec, entry
+                    return
+            slot = self.next_slot % self.capacity
+            self.vectors[slot] = vec
+            if slot < len(self.entries):
+                self.entries[slot] = entry
+            else:
+                self.entries.append(entry)
+            self.next_slot += 1
+
+    def stats(self):
+        with self.lock:
+            total = sum(self.counts.values())
+            return {
+                "entries": len(self.entries),
+                **self.counts,
+                "hit_rate": round(self.counts["hit"] / total, 3) if total else 0.0,
+                "seed_rate": round(self.counts["seed"] / total, 3) if total else 0.0,
+                "latency_saved_s": round(self.latency_saved, 2),
+            }
+
+vision_cache = SemanticCache()
+
+# ===== PROVIDER ROUTING =====
+
+CORE_TIMEOUT = 120
+HEDGE_DEFAULT_DELAY = float(os.getenv("HEDGE_DEFAULT_DELAY", "5.0"))
+PHASE_PREFERENCES = {"architect": "anthropic", "parser": "anthropic"}
+HEDGE_WORKERS = 8
+HEDGE_POOL = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="genesis-hedge")
+HEDGE_SLOTS = threading.BoundedSemaphore(HEDGE_WORKERS)
+PROBE_TIMEOUT = 30
+PROBE_MESSAGES = [{"role": "user", "content": "ping"}]
+PROBE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="genesis-probe")
+
+class ProviderRouter:
+    """Rolling per-provider latency/error window used to route each phase"""
+    def __init__(self, window=50, min_samples=3, max_error_rate=0.5, slack=1.5, max_age=300, probe_interval=60):
+        self.window = window
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.slack = slack  # preferred provider wins unless this much slower
+        self.max_age = max_age  # samples older than this are ignored, so bad providers recover
+        self.probe_interval = probe_interval
+        self.samples = {}
+        self.last_probe = {}
+        self.created = time.time()
+        self.lock = threading.Lock()
+
+    def record(self, provider, latency, ok):
+        with self.lock:
+            self.samples.setdefault(provider, deque(maxlen=self.window)).append((time.time(), latency, ok))
+
+    def _recent(self, provider):
+        cutoff = time.time() - self.max_age
+        with self.lock:
+            return [(l, ok) for t, l, ok in self.samples.get(provider, ()) if t >= cutoff]
+
+    def percentile(self, provider, pct):
+        lat = sorted(l for l, ok in self._recent(provider) if ok)
+        if len(lat) < self.min_samples:
+            return None
+        return lat[min(len(lat) - 1, int(round(pct / 100 * (len(lat) - 1))))]
+
+    def error_rate(self, provider):
+        window = self._recent(provider)
+        return sum(1 for _, ok in window if not ok) / len(window) if window else 0.0
+
+    def healthy(self, provider):
+        return self.error_rate(provider) < self.max_error_rate
+
+    def rank(self, candidates, preferred=None):
+        """Order candidates: healthy before unhealthy, then by median latency (no side effects)"""
+        candidates = list(dict.fromkeys(candidates))
+        if preferred in candidates:
+            candidates.remove(preferred)
+            candidates.insert(0, preferred)
+
+        def key(p):
+            p50 = self.percentile(p, 50)
+            if p == preferred:  # unmeasured preference is tried first
+                p50 = 0.0 if p50 is None else p50 / self.slack
+            return (not self.healthy(p), p50 is None, p50 or 0.0)
+        return sorted(candidates, key=key)
+
+    def due_probes(self, providers):
+        """Unhealthy or unmeasured providers whose probe interval has elapsed; marks them probed"""
+        stale = [p for p in providers if not self.healthy(p) or self.percentile(p, 50) is None]
+        now = time.time()
+        with self.lock:
+            due = [p for p in stale if now - self.last_probe.get(p, self.created) >= self.probe_interval]
+            for p in due:
+                self.last_probe[p] = now
+        return due
+
+    def hedge_delay(self, provider):
+        return self.percentile(provider, 95) or HEDGE_DEFAULT_DELAY
+
+    def snapshot(self):
+        with self.lock:
+            providers = list(self.samples)
+        return {p: {
+            "p50_s": self.percentile(p, 50),
+            "p95_s": self.percentile(p, 95),
+            "error_rate": round(self.error_rate(p), 3),
+            "healthy": self.healthy(p),
+            "last_probe_s_ago": round(time.time() - self.last_probe[p], 1) if p in self.last_probe else None,
+        } for p in providers}
+
+router = ProviderRouter()
+
+def route(phase, provider, available=None):
+    """Rank providers for a phase; the user's choice is preferred unless the phase has its own"""
+    available = available or get_providers()
+    preferred = PHASE_PREFERENCES.get(phase, provider)
+    if preferred not in available:
+        preferred = provider
+    ranked = router.rank([provider] + available, preferred)
+    for p in router.due_probes(ranked[1:]):
+        PROBE_POOL.submit(_probe, p)
+    return ranked
+
+def _probe(provider):
+    """Background ping so a starved or unmeasured provider gets fresh samples off the user's path"""
+    try:
+        _post_chat(provider, PROBE_MESSAGES, timeout=PROBE_TIMEOUT)
+    except Exception:
+        pass  # already recorded as a failed sample
+
+def _post_chat(provider, messages, timeout=CORE_TIMEOUT):
+    """Single chat completion; records latency/outcome for the router"""
+    start = time.time()
     try:
         resp = requests.post(f"{ORCHESTRATOR}/v1/chat/completions", json={
-            "provider": provider, 
-            "messages": messages, 
+            "provider": provider,
+            "messages": messages,
             "use_memory": True
-        }, timeout=120)
-        return resp.json()["content"]
+        }, timeout=timeout)
+        resp.raise_for_status()
+        content = resp.json()["content"]
+    except Exception:
+        router.record(provider, time.time() - start, False)
+        raise
+    router.record(provider, time.time() - start, True)
+    return content
+
+def _submit_hedge(provider, messages):
+    """Start a request on the hedge pool only if a worker is free; None otherwise.
+
+    A sync loser cannot be cancelled once running, so it keeps its worker for up
+    to CORE_TIMEOUT; refusing to queue means no call ever waits behind one.
+    """
+    if not HEDGE_SLOTS.acquire(blocking=False):
+        return None
+    fut = HEDGE_POOL.submit(_post_chat, provider, messages)
+    fut.add_done_callback(lambda _: HEDGE_SLOTS.release())
+    return fut
+
+def _sequential_chat(providers, messages):
+    """Bounded fallback: primary, then runner-up"""
+    error = None
+    for p in providers[:2]:
+        try:
+            return _post_chat(p, messages)
+        except Exception as e:
+            error = e
+    raise error
+
+def _hedged_chat(providers, messages):
+    """Fire the primary; fire the runner-up once the primary fails or exceeds its p95; return the first success"""
+    primary = _submit_hedge(providers[0], messages)
+    if primary is None:  # every hedge worker is busy: no hedging, run on this thread
+        return _sequential_chat(providers, messages)
+    pending = {primary}
+    backups = list(providers[1:2])
+    delay = router.hedge_delay(providers[0])
+    error = None
+    while pending:
+        done, pending = wait(pending, timeout=delay if backups else None, return_when=FIRST_COMPLETED)
+        for fut in done:
+            if fut.exception() is None:
+                for other in pending:
+                    other.cancel()  # in-flight loser still records its latency
+                return fut.result()
+            error = fut.exception()
+        if backups:  # hedge delay elapsed or the primary failed
+            backup = _submit_hedge(backups[0], messages)
+            if backup is not None:
+                pending.add(backup)
+                backups.pop(0)
+            elif not pending:  # primary failed and no free worker: run the runner-up here
+                return _post_chat(backups.pop(0), messages)
+    raise error
+
+def call_core(messages, provider="grok", phase=None, hedge=False, run=None):
+    """Call orchestrator API, routed to the fastest healthy provider for the phase"""
+    if phase:
+        messages, stats = compact_messages(messages, phase)
+        compaction.record(run, stats)
+    providers = route(phase, provider) if phase else [provider]
+    try:
+        if hedge and len(providers) > 1:
+            return _hedged_chat(providers, messages)
+        return _sequential_chat(providers, messages)
     except Exception as e:
         return f"[System Error]: {e}"
 
@@ -57,13 +464,35 @@ def get_pricing():
     except Exception as e:
         return {"error": str(e)}
 
-def get_providers():
-    """Get list of available providers"""
+PROVIDERS_TTL = float(os.getenv("PROVIDERS_TTL", "60"))
+DEFAULT_PROVIDERS = ["grok", "anthropic", "local"]
+PROVIDERS_CACHE = {"at": None, "providers": None}  # shared by the sync and async paths
+
+def _cached_providers(refresh=False):
+    """Provider list from the last fetch, or None when it is missing or older than PROVIDERS_TTL"""
+    at = PROVIDERS_CACHE["at"]
+    if refresh or at is None or time.time() - at > PROVIDERS_TTL:
+        return None
+    return PROVIDERS_CACHE["providers"] or DEFAULT_PROVIDERS
+
+def _store_providers(data):
+    """Cache a /v1/providers reply; a failed fetch keeps the last good list until the next TTL"""
+    providers = data.get("providers") if isinstance(data, dict) else None
+    if providers:
+        PROVIDERS_CACHE["providers"] = providers
+    PROVIDERS_CACHE["at"] = time.time()
+    return PROVIDERS_CACHE["providers"] or DEFAULT_PROVIDERS
+
+def get_providers(refresh=False):
+    """Get list of available providers (cached for PROVIDERS_TTL seconds)"""
+    cached = _cached_providers(refresh)
+    if cached:
+        return cached
     try:
         resp = requests.get(f"{ORCHESTRATOR}/v1/providers", timeout=10)
-        return resp.json().get("providers", ["grok", "anthropic", "local"])
-    except:
-        return ["grok", "anthropic", "local"]
+        return _store_providers(resp.json())
+    except Exception:
+        return _store_providers(None)
 
 def get_all_connections():
     """Get all connections from all libraries"""
@@ -81,16 +510,203 @@ def get_connection_stats():
     except Exception as e:
         return {"error": str(e)}
 
+# ===== MUTATION OUTBOX =====
+# Connection and vault mutations are written to a local SQLite outbox and
+# acknowledged immediately; a background worker drains them to the
+# orchestrator with retries, so a slow or down orchestrator never loses
+# operator input or stalls the UI.
+
+OUTBOX_PATH = os.path.expanduser(os.getenv("STUDIO_OUTBOX_PATH", "~/.genesis_studio/outbox.db"))
+OUTBOX_BATCH = 20
+OUTBOX_WORKERS = 4
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_REPLY_TTL = 300  # seconds a reply stays viewable before it is discarded
+OUTBOX_RETENTION = 3600  # seconds sent/coalesced rows are kept for the Pending Changes view
+PRIVATE_PATHS = ("/v1/vault/",)  # replies may hold secrets: memory only, handed out once
+OUTBOX = None
+
+class Outbox:
+    """Append-only mutation log drained in coalesced batches with idempotency keys"""
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        os.chmod(path, 0o600)  # pending payloads can hold API keys / passwords until sent
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            idempotency_key TEXT UNIQUE,
+            resource TEXT,
+            method TEXT,
+            path TEXT,
+            payload TEXT,
+            status TEXT DEFAULT 'pending',
+            attempts INTEGER DEFAULT 0,
+            next_attempt REAL DEFAULT 0,
+            last_error TEXT,
+            created REAL,
+            updated REAL)""")
+        if "response" not in {c[1] for c in self.db.execute("PRAGMA table_info(outbox)")}:
+            self.db.execute("ALTER TABLE outbox ADD COLUMN response TEXT")  # outboxes from before responses were kept
+        self.db.execute("UPDATE outbox SET status='pending' WHERE status='inflight'")  # crashed mid-send
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.worker = None
+        self.replies = {}  # outbox id -> (received, parsed reply) for PRIVATE_PATHS
+        # Separate from HEDGE_POOL so a backlog of syncs never delays hedged model calls
+        self.pool = ThreadPoolExecutor(max_workers=OUTBOX_WORKERS, thread_name_prefix="genesis-outbox")
+
+    def _exec(self, sql, args=()):
+        with self.lock:
+            return self.db.execute(sql, args).fetchall()
+
+    def enqueue(self, method, path, payload=None, resource=None):
+        """Record a mutation and return immediately; a later write with the same method supersedes an earlier one"""
+        key, now = uuid.uuid4().hex, time.time()
+        with self.lock:
+            cur = self.db.execute(
+                "INSERT INTO outbox (idempotency_key, resource, method, path, payload, created, updated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, resource, method, path, json.dumps(payload) if payload is not None else None, now, now))
+        self.start()
+        self.wake.set()
+        return {"queued": True, "outbox_id": cur.lastrowid, "idempotency_key": key, "status": "pending"}
+
+    def start(self):
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._run, name="genesis-outbox", daemon=True)
+            self.worker.start()
+
+    def _run(self):
+        while True:
+            try:
+                self.drain_once()
+                self.prune()
+            except Exception as e:
+                print(f"[ERROR] Outbox drain failed: {e}")
+            due = self._exec("SELECT MIN(next_attempt) FROM outbox WHERE status='pending'")[0][0]
+            self.wake.wait(timeout=5 if due is None else min(max(due - time.time(), 0.05), 5))
+            self.wake.clear()
+
+    def drain_once(self):
+        """Send one batch of due mutations; returns the number attempted"""
+        now = time.time()
+        with self.lock:
+            # Only a newer write with the same method supersedes a pending one: a DELETE
+            # followed by a re-add must still reach the orchestrator as both.
+            self.db.execute("""UPDATE outbox SET status='coalesced', payload=NULL, updated=?
+                WHERE status='pending' AND resource IS NOT NULL AND EXISTS (
+                    SELECT 1 FROM outbox o2 WHERE o2.resource = outbox.resource
+                    AND o2.method = outbox.method AND o2.id > outbox.id AND o2.status != 'coalesced')""", (now,))
+            # At most one mutation per resource in flight, oldest first
+            rows = self.db.execute(
+                "SELECT id, idempotency_key, method, path, payload, attempts FROM outbox "
+                "WHERE status='pending' AND next_attempt <= ? AND (resource IS NULL OR NOT EXISTS ("
+                "SELECT 1 FROM outbox o2 WHERE o2.resource = outbox.resource AND o2.id < outbox.id "
+                "AND o2.status IN ('pending', 'inflight'))) ORDER BY id LIMIT ?", (now, OUTBOX_BATCH)).fetchall()
+            self.db.executemany("UPDATE outbox SET status='inflight' WHERE id=?", [(r[0],) for r in rows])
+        list(self.pool.map(self._send, rows))
+        return len(rows)
+
+    def _send(self, row):
+        row_id, key, method, path, payload, attempts = row
+        try:
+            resp = requests.request(method, f"{ORCHESTRATOR}{path}", timeout=10,
+                                    json=json.loads(payload) if payload else None,
+                                    headers={"Idempotency-Key": key})
+            if resp.status_code < 400:
+                body = resp.text
+                if path.startswith(PRIVATE_PATHS):
+                    with self.lock:
+                        self.replies[row_id] = (time.time(), self._parse_body(body) if body else {"status": "sent"})
+                    body = None
+                self._exec("UPDATE outbox SET status='sent', payload=NULL, response=?, attempts=?, last_error=NULL, updated=? WHERE id=?",
+                           (body, attempts + 1, time.time(), row_id))
+                return
+            error, permanent = f"HTTP {resp.status_code}: {resp.text[:200]}", resp.status_code < 500 and resp.status_code not in (408, 429)
+        except Exception as e:
+            error, permanent = str(e), False
+        attempts += 1
+        if permanent or attempts >= OUTBOX_MAX_ATTEMPTS:
+            self._exec("UPDATE outbox SET status='failed', attempts=?, last_error=?, updated=? WHERE id=?",
+                       (attempts, error, time.time(), row_id))
+        else:
+            self._exec("UPDATE outbox SET status='pending', attempts=?, last_error=?, next_attempt=?, updated=? WHERE id=?",
+                       (attempts, error, time.time() + min(2 ** attempts, 60), time.time(), row_id))
+
+    def prune(self):
+        """Drop expired replies and old sent/coalesced rows so the file stays small"""
+        now = time.time()
+        self._exec("UPDATE outbox SET response=NULL WHERE response IS NOT NULL AND updated < ?",
+                   (now - OUTBOX_REPLY_TTL,))
+        self._exec("DELETE FROM outbox WHERE status IN ('sent', 'coalesced') AND updated < ?",
+                   (now - OUTBOX_RETENTION,))
+        with self.lock:
+            for row_id in [i for i, (t, _) in self.replies.items() if t < now - OUTBOX_REPLY_TTL]:
+                del self.replies[row_id]
+
+    def take_reply(self, row_id):
+        """Hand out a private reply once; None while the row is still unsent"""
+        with self.lock:
+            reply = self.replies.pop(row_id, None)
+        return None if reply is None else reply[1]
+
+    def row_status(self, row_id):
+        rows = self._exec("SELECT status, last_error FROM outbox WHERE id=?", (row_id,))
+        return rows[0] if rows else (None, None)
+
+    def retry_failed(self):
+        self._exec("UPDATE outbox SET status='pending', attempts=0, next_attempt=0 WHERE status='failed'")
+        self.start()
+        self.wake.set()
+        return self.status()
+
+    def status(self, limit=50, sent_limit=10):
+        """Counts, pending/failed items (payloads omitted) and replies to recent non-vault sends"""
+        counts = dict(self._exec("SELECT status, COUNT(*) FROM outbox GROUP BY status"))
+        rows = self._exec(
+            "SELECT id, method, path, status, attempts, last_error, created FROM outbox "
+            "WHERE status IN ('pending', 'inflight', 'failed') ORDER BY id DESC LIMIT ?", (limit,))
+        sent = self._exec(
+            "SELECT id, method, path, response, updated FROM outbox "
+            "WHERE status='sent' AND updated >= ? ORDER BY updated DESC LIMIT ?",
+            (time.time() - OUTBOX_REPLY_TTL, sent_limit))
+        return {
+            "counts": counts,
+            "items": [{
+                "id": i, "request": f"{m} {p}", "status": st_, "attempts": a,
+                "last_error": err, "age_s": round(time.time() - c, 1),
+            } for i, m, p, st_, a, err, c in rows],
+            "recently_sent": [{
+                "id": i, "request": f"{m} {p}",
+                "response": "(see Vault tab)" if p.startswith(PRIVATE_PATHS) else self._parse_body(body),
+                "sent_s_ago": round(time.time() - u, 1),
+            } for i, m, p, body, u in sent],
+        }
+
+    @staticmethod
+    def _parse_body(body):
+        try:
+            return json.loads(body) if body else None
+        except ValueError:
+            return body
+
+def get_outbox():
+    """Lazily open the outbox and start its worker"""
+    global OUTBOX
+    if OUTBOX is None:
+        OUTBOX = Outbox(OUTBOX_PATH)
+        OUTBOX.start()
+    return OUTBOX
+
 # ===== CONNECTION MANAGEMENT =====
 
-def add_api_connection(conn_id, name, base_url, auth_type, api_key, models_str):
-    """Add API connection"""
+def api_connection_payload(conn_id, name, base_url, auth_type, api_key, models_str):
+    """Validate form input and build the API connection payload"""
     if not conn_id or not name or not base_url:
-        return {"error": "Connection ID, Name, and Base URL are required"}
+        return None, {"error": "Connection ID, Name, and Base URL are required"}
     
     models = [m.strip() for m in models_str.split(",") if m.strip()] if models_str else []
     
-    payload = {
+    return {
         "conn_id": conn_id,
         "name": name,
         "base_url": base_url,
@@ -99,87 +715,94 @@ def add_api_connection(conn_id, name, base_url, auth_type, api_key, models_str):
         "models": models,
         "capabilities": ["chat", "completion"],
         "enabled": True
-    }
-    try:
-        r = requests.post(f"{ORCHESTRATOR}/v1/connections/api", json=payload, timeout=10)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
-
-def remove_api_connection(conn_id):
-    """Remove API connection"""
-    try:
-        r = requests.delete(f"{ORCHESTRATOR}/v1/connections/api/{conn_id}", timeout=10)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
+    }, None
 
-def add_webhook(webhook_id, name, url, method, events_str):
-    """Add webhook"""
+def webhook_payload(webhook_id, name, url, method, events_str):
+    """Validate form input and build the webhook payload"""
     if not webhook_id or not name or not url:
-        return {"error": "Webhook ID, Name, and URL are required"}
+        return None, {"error": "Webhook ID, Name, and URL are required"}
     
     events = [e.strip() for e in events_str.split(",") if e.strip()] if events_str else ["all"]
     
-    payload = {
+    return {
         "webhook_id": webhook_id,
         "name": name,
         "url": url,
         "method": method,
         "events": events,
         "enabled": True
-    }
-    try:
-        r = requests.post(f"{ORCHESTRATOR}/v1/connections/webhook", json=payload, timeout=10)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
-
-def remove_webhook(webhook_id):
-    """Remove webhook"""
-    try:
-        r = requests.delete(f"{ORCHESTRATOR}/v1/connections/webhook/{webhook_id}", timeout=10)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
+    }, None
 
-def add_mcp_server(server_id, name, command, args_str):
-    """Add MCP server"""
+def mcp_server_payload(server_id, name, command, args_str):
+    """Validate form input and build the MCP server payload"""
     if not server_id or not name or not command:
-        return {"error": "Server ID, Name, and Command are required"}
+        return None, {"error": "Server ID, Name, and Command are required"}
     
     args = [a.strip() for a in args_str.split(",") if a.strip()] if args_str else []
     
-    payload = {
+    return {
         "server_id": server_id,
         "name": name,
         "command": command,
         "args": args,
         "capabilities": ["read", "write"],
         "enabled": True
-    }
-    try:
-        r = requests.post(f"{ORCHESTRATOR}/v1/connections/mcp", json=payload, timeout=10)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
+    }, None
+
+def add_api_connection(conn_id, name, base_url, auth_type, api_key, models_str):
+    """Add API connection (queued in the outbox)"""
+    payload, error = api_connection_payload(conn_id, name, base_url, auth_type, api_key, models_str)
+    if error:
+        return error
+    return get_outbox().enqueue("POST", "/v1/connections/api", payload, resource=f"api:{conn_id}")
+
+def remove_api_connection(conn_id):
+    """Remove API connection (queued in the outbox)"""
+    return get_outbox().enqueue("DELETE", f"/v1/connections/api/{conn_id}", resource=f"api:{conn_id}")
+
+def add_webhook(webhook_id, name, url, method, events_str):
+    """Add webhook (queued in the outbox)"""
+    payload, error = webhook_payload(webhook_id, name, url, method, events_str)
+    if error:
+        return error
+    return get_outbox().enqueue("POST", "/v1/connections/webhook", payload, resource=f"webhook:{webhook_id}")
+
+def remove_webhook(webhook_id):
+    """Remove webhook (queued in the outbox)"""
+    return get_outbox().enqueue("DELETE", f"/v1/connections/webhook/{webhook_id}", resource=f"webhook:{webhook_id}")
+
+def add_mcp_server(server_id, name, command, args_str):
+    """Add MCP server (queued in the outbox)"""
+    payload, error = mcp_server_payload(server_id, name, command, args_str)
+    if error:
+        return error
+    return get_outbox().enqueue("POST", "/v1/connections/mcp", payload, resource=f"mcp:{server_id}")
 
 def remove_mcp_server(server_id):
-    """Remove MCP server"""
-    try:
-        r = requests.delete(f"{ORCHESTRATOR}/v1/connections/mcp/{server_id}", timeout=10)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
+    """Remove MCP server (queued in the outbox)"""
+    return get_outbox().enqueue("DELETE", f"/v1/connections/mcp/{server_id}", resource=f"mcp:{server_id}")
+
+def create_cipher(name, username, password, uri, notes, auto_gen):
+    """Create vault credential (queued in the outbox; see vault_reply_async for the reply)"""
+    return get_outbox().enqueue("POST", "/v1/vault/cipher", {
+        "name": name,
+        "username": username,
+        "password": password if password else None,
+        "uri": uri if uri else None,
+        "notes": notes if notes else None,
+        "auto_generate_password": auto_gen
+    })
 
 # ===== VOICE-COMMANDED CONNECTION MANAGEMENT =====
 
-def parse_connection_from_voice(voice_input, connection_type):
-    """Use AI to parse connection details from voice input"""
-    prompt = f"""Parse this voice command to add a {connection_type} connection.
-Extract the following details and respond in JSON format:
+def voice_parser_messages(voice_input, connection_type):
+    """Parser prompt for a spoken connection command"""
+    # Instructions go in the system message, which compaction never touches;
+    # only the user's voice input is subject to the parser token budget.
+    instructions = f"""You are a connection parser. Extract structured data from voice commands and respond in JSON format only.
 
-Voice input: "{voice_input}"
+Parse the user's voice command to add a {connection_type} connection.
+Extract the following details and respond in JSON format:
 
 For API connections, extract:
 - conn_id (short identifier, lowercase with underscores)
@@ -204,33 +827,32 @@ For MCP Servers, extract:
 
 Respond ONLY with valid JSON. If information is missing, use null."""
 
+    return [
+        {"role": "system", "content": instructions},
+        {"role": "user", "content": f'Voice input: "{voice_input}"'}
+    ]
+
+def parsed_connection(response):
+    """Extract the JSON object from the parser's reply"""
+    json_match = re.search(r'\{.*\}', response, re.DOTALL)
+    if json_match:
+        return json.loads(json_match.group())
+    return {"error": "Could not parse voice input"}
+
+def parse_connection_from_voice(voice_input, connection_type):
+    """Use AI to parse connection details from voice input"""
     try:
-        response = call_core([
-            {"role": "system", "content": "You are a connection parser. Extract structured data from voice commands and respond in JSON format only."},
-            {"role": "user", "content": prompt}
-        ], provider="anthropic" if "anthropic" in get_providers() else "grok")
-        
-        # Extract JSON from response
-        import json
-        import re
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            parsed = json.loads(json_match.group())
-            return parsed
-        else:
-            return {"error": "Could not parse voice input"}
+        return parsed_connection(call_core(voice_parser_messages(voice_input, connection_type),
+                                           provider="grok", phase="parser", hedge=True))
     except Exception as e:
         return {"error": str(e)}
 
-def confirm_and_add_connection(voice_input, connection_type):
-    """Parse voice input, confirm with user, and add connection"""
-    # Step 1: Parse voice input
-    parsed = parse_connection_from_voice(voice_input, connection_type)
-    
+def confirmation_message(parsed, connection_type):
+    """Format parsed connection details for the user to review"""
     if "error" in parsed:
-        return f"❌ Error: {parsed['error']}"
+        return f"❌ Error: {parsed['error']}", parsed
     
-    # Step 2: Format confirmation message
+    # Format confirmation message
     confirmation = f"🤖 **AI Parsed the following {connection_type} connection:**\n\n"
     for key, value in parsed.items():
         if value is not None:
@@ -241,6 +863,10 @@ def confirm_and_add_connection(voice_input, connection_type):
     
     return confirmation, parsed
 
+def confirm_and_add_connection(voice_input, connection_type):
+    """Parse voice input, confirm with user, and add connection"""
+    return confirmation_message(parse_connection_from_voice(voice_input, connection_type), connection_type)
+
 def voice_add_connection(voice_input, connection_type):
     """Voice-commanded connection addition with AI confirmation"""
     if not voice_input.strip():
@@ -253,16 +879,46 @@ def voice_add_connection(voice_input, connection_type):
 
 # ===== PROJECT CREATION =====
 
-def project_manager(prompt, provider, history):
-    """Multi-agent project creation workflow"""
+ARCHITECT_PROMPT = "You are a Chief Architect. Outline the files and structure needed for this project."
+ENGINEER_PROMPT = "You are a 10x Engineer. Write the main implementation code based on this architecture."
+
+def architect_messages(prompt, seed=None):
+    """Architect messages, optionally seeded with a similar prior design"""
+    messages = [{"role": "system", "content": ARCHITECT_PROMPT}]
+    if seed:
+        messages.append({"role": "user", "content": f"A similar project ('{seed['vision']}') used this design. Adapt it where it fits:\n{seed['design']}"})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+def cache_hit_log(cached, score):
+    """Swarm log for a build served from the semantic cache"""
+    return (f"\n\n> [CACHE]: Reusing build of '{cached['vision']}' (similarity {score:.2f}, saved ~{cached['elapsed_s']}s)\n"
+            f"\n> [ARCHITECT]:\n{cached['design']}\n\n> [CODE]:\n{cached['code'][:500]}...\n\n[✓ DONE]\n")
+
+def is_error(content):
+    """True for call_core's error sentinel"""
+    return content.startswith("[System Error]")
+
+async def project_manager(prompt, provider, history, regenerate=False):
+    """Multi-agent project creation workflow (async generator; Gradio streams each yield).
+
+    regenerate skips the semantic cache; the fresh build then replaces the cached one.
+    """
     st.listening = True
+    start = time.time()
+    kind, cached, score = ("miss", None, 0.0) if regenerate else vision_cache.classify(prompt)
+    if kind == "hit":
+        st.listening = False
+        yield history + cache_hit_log(cached, score)
+        return
+    run = compaction.begin_run(prompt)
     yield history + f"\n\n> [GENESIS]: Architecting '{prompt}'...\n"
     
     # 1. Architect Phase
-    design = call_core([
-        {"role": "system", "content": "You are a Chief Architect. Outline the files and structure needed for this project."},
-        {"role": "user", "content": prompt}
-    ], provider="anthropic" if "anthropic" in get_providers() else provider)
+    design = await call_core_async(architect_messages(prompt, cached if kind == "seed" else None),
+                                   provider=provider, phase="architect", run=run)
+    if kind == "seed":
+        history += f"\n> [CACHE]: Seeded from '{cached['vision']}' (similarity {score:.2f})\n"
     
     history += f"\n> [ARCHITECT]:\n{design}\n"
     yield history
@@ -277,30 +933,177 @@ def project_manager(prompt, provider, history):
     history += "\n> [ENGINEER]: Generating code...\n"
     yield history
     
-    code = call_core([
-        {"role": "system", "content": "You are a 10x Engineer. Write the main implementation code based on this architecture."},
+    code = await call_core_async([
+        {"role": "system", "content": ENGINEER_PROMPT},
         {"role": "user", "content": design}
-    ], provider=provider)
+    ], provider=provider, phase="engineer", run=run)
     
     history += f"\n> [CODE]:\n{code[:500]}...\n\n[✓ DONE]\n"
+    if not is_error(design) and not is_error(code):
+        vision_cache.add(prompt, design, code, time.time() - start)
     st.listening = False
     yield history
 
-def listen_loop(audio):
-    """Process voice input (only when not muted)"""
-    if not st.listening or st.muted:
+# ===== STREAMING TRANSCRIPTION =====
+
+ASR_RATE = 16000
+
+class AudioRing:
+    """Preallocated float32 ring buffer addressed by absolute sample position"""
+    def __init__(self, seconds=30, rate=ASR_RATE):
+        self.size = int(seconds * rate)
+        self.buf = np.zeros(self.size, dtype=np.float32)
+        self.scratch = np.zeros(self.size, dtype=np.float32)  # contiguous window for the decoder
+        self.head = 0  # total samples ever written
+
+    def write(self, samples):
+        n = len(samples)
+        if n > self.size:
+            self.head += n - self.size
+            samples, n = samples[-self.size:], self.size
+        pos = self.head % self.size
+        first = min(n, self.size - pos)
+        self.buf[pos:pos + first] = samples[:first]
+        self.buf[:n - first] = samples[first:]
+        self.head += n
+
+    def read(self, start):
+        """Window [start, head) copied into the scratch buffer (clamped to what is retained)"""
+        start = max(start, self.head - self.size, 0)
+        n = self.head - start
+        pos = start % self.size
+        first = min(n, self.size - pos)
+        self.scratch[:first] = self.buf[pos:pos + first]
+        self.scratch[first:n] = self.buf[:n - first]
+        return self.scratch[:n]
+
+def to_mono_16k(audio):
+    """Gradio (rate, samples) chunk -> mono float32 at ASR_RATE"""
+    rate, data = audio
+    data = np.asarray(data)
+    if data.ndim > 1:
+        data = data.mean(axis=1)
+    if np.issubdtype(data.dtype, np.integer):
+        data = data.astype(np.float32) / np.iinfo(data.dtype).max
+    data = data.astype(np.float32, copy=False)
+    if rate != ASR_RATE and len(data):
+        n = int(len(data) * ASR_RATE / rate)
+        data = np.interp(np.linspace(0, len(data) - 1, n), np.arange(len(data)), data).astype(np.float32)
+    return data
+
+def merge_overlap(committed, text, max_words=6):
+    """Append text to committed, dropping words re-decoded from the overlap"""
+    old, new = committed.split(), text.split()
+    for k in range(min(max_words, len(old), len(new)), 0, -1):
+        if [w.lower().strip(".,") for w in old[-k:]] == [w.lower().strip(".,") for w in new[:k]]:
+            new = new[k:]
+            break
+    return " ".join(old + new)
+
+class StreamingTranscriber:
+    """Incremental Whisper decoding over a ring buffer with energy-based endpointing.
+
+    Every STEP_S of new speech the uncommitted tail (plus OVERLAP_S of already
+    committed audio) is re-decoded with the committed text as initial prompt.
+    All but the last segment are committed, so each decode stays short. After
+    SILENCE_S of silence the remainder is decoded and emitted as a final.
+    """
+    STEP_S = 1.0
+    OVERLAP_S = 0.5
+    SILENCE_S = 0.7
+    PREROLL_S = 0.2
+    ENERGY = 0.01
+
+    def __init__(self):
+        self.ring = AudioRing()
+        self.reset()
+
+    def reset(self):
+        self.utt_start = None
+        self.commit_pos = 0
+        self.committed = ""
+        self.last_decode = 0
+        self.last_voice = 0
+        self.last_voice_wall = 0.0
+
+    def _decode(self, final):
+        start = max(self.commit_pos - int(self.OVERLAP_S * ASR_RATE), self.utt_start, self.ring.head - self.ring.size)
+        audio = self.ring.read(start)
+        segments, _ = WHISPER.transcribe(audio, beam_size=1, initial_prompt=self.committed[-200:] or None,
+                                         condition_on_previous_text=False)
+        segments = list(segments)
+        self.last_decode = self.ring.head
+        if not final and len(segments) > 1:
+            for seg in segments[:-1]:
+                self.committed = merge_overlap(self.committed, seg.text.strip())
+            self.commit_pos = start + int(segments[-2].end * ASR_RATE)
+            segments = segments[-1:]
+        return merge_overlap(self.committed, " ".join(seg.text.strip() for seg in segments))
+
+    def feed(self, audio):
+        """Add a chunk; returns {"partial": ...}, {"final": ..., "latency_s": ...} or None"""
+        samples = to_mono_16k(audio)
+        self.ring.write(samples)
+        if len(samples) and float(np.sqrt(np.mean(samples ** 2))) > self.ENERGY:
+            if self.utt_start is None:
+                self.utt_start = max(self.ring.head - len(samples) - int(self.PREROLL_S * ASR_RATE), 0)
+                self.commit_pos = self.last_decode = self.utt_start
+            self.last_voice = self.ring.head
+            self.last_voice_wall = time.time()
+        if self.utt_start is None:
+            return None
+        if self.ring.head - self.last_voice >= self.SILENCE_S * ASR_RATE:
+            text = self._decode(final=True)
+            latency = time.time() - self.last_voice_wall
+            self.reset()
+            return {"final": text, "latency_s": round(latency, 3)} if text else None
+        if self.ring.head - self.last_decode >= self.STEP_S * ASR_RATE:
+            return {"partial": self._decode(final=False)}
         return None
+
+# Transcribers are per session (held in gr.State) so concurrent speakers never share a ring buffer.
+
+def listen_loop(audio, asr):
+    """Process voice input (only when not muted); returns the session's transcriber"""
+    asr = asr or StreamingTranscriber()
+    if not st.listening:
+        asr.reset()  # don't carry audio from between runs into the next one
+        return asr
+    if st.muted or audio is None:
+        return asr
     
     lazy_load()
     try:
-        segments, _ = WHISPER.transcribe(audio, beam_size=1)
-        text = " ".join([s.text for s in segments]).strip()
+        event = asr.feed(audio)
+        text = (event or {}).get("final") or (event or {}).get("partial") or ""
         if len(text) > 2:
             st.interrupt = True
-            return f"[🎤 VOICE]: {text}"
     except Exception as e:
         print(f"[ERROR] Whisper transcription failed: {e}")
-    return None
+    return asr
+
+def voice_command_stream(audio, asr):
+    """Stream mic audio; partials update the live transcript, finals are emitted for the parser.
+
+    Parsing is left to a separate event on the final transcript so this
+    listener never blocks on a model call and keeps consuming audio.
+    """
+    asr = asr or StreamingTranscriber()
+    if st.muted or audio is None:
+        return gr.update(), gr.update(), gr.update(), asr
+    
+    lazy_load()
+    try:
+        event = asr.feed(audio)
+    except Exception as e:
+        print(f"[ERROR] Whisper transcription failed: {e}")
+        return gr.update(), gr.update(), gr.update(), asr
+    if not event:
+        return gr.update(), gr.update(), gr.update(), asr
+    if "partial" in event:
+        return f"… {event['partial']}", gr.update(), gr.update(), asr
+    latency = f"{event['latency_s']:.2f}s (includes {StreamingTranscriber.SILENCE_S}s endpointing silence)"
+    return event["final"], latency, event["final"], asr
 
 def toggle_mute():
     """Toggle mute state"""
@@ -308,7 +1111,467 @@ def toggle_mute():
     status = "🔇 MUTED" if st.muted else "🎤 ACTIVE"
     return status
 
+# ===== ASYNC ORCHESTRATOR PATH =====
+# Gradio awaits these on its event loop, so slow orchestrator I/O no longer
+# pins a worker thread per session. The sync functions above stay as the
+# thread-based path (see load_test.py for a side-by-side measurement).
+
+ASYNC_CLIENT = None
+
+def get_async_client():
+    """Lazily create the shared httpx.AsyncClient"""
+    global ASYNC_CLIENT
+    if ASYNC_CLIENT is None or ASYNC_CLIENT.is_closed:
+        ASYNC_CLIENT = httpx.AsyncClient(
+            base_url=ORCHESTRATOR, timeout=10,
+            limits=httpx.Limits(max_connections=500, max_keepalive_connections=100))
+    return ASYNC_CLIENT
+
+async def close_async_client():
+    """Close the shared client (must run on the loop that created it)"""
+    global ASYNC_CLIENT
+    if ASYNC_CLIENT is not None:
+        await ASYNC_CLIENT.aclose()
+        ASYNC_CLIENT = None
+
+async def orchestrator_request(method, path, timeout=10, **kwargs):
+    """Async orchestrator call returning parsed JSON or an error dict"""
+    try:
+        resp = await get_async_client().request(method, path, timeout=timeout, **kwargs)
+        return resp.json()
+    except Exception as e:
+        return {"error": str(e)}
+
+async def get_providers_async(refresh=False):
+    """Async get_providers"""
+    return _cached_providers(refresh) or _store_providers(await orchestrator_request("GET", "/v1/providers"))
+
+async def _post_chat_async(provider, messages):
+    """Async _post_chat; records latency/outcome for the router"""
+    start = time.time()
+    try:
+        resp = await get_async_client().post("/v1/chat/completions", json={
+            "provider": provider,
+            "messages": messages,
+            "use_memory": True
+        }, timeout=CORE_TIMEOUT)
+        resp.raise_for_status()
+        content = resp.json()["content"]
+    except asyncio.CancelledError:
+        raise  # lost a hedge race; not a provider failure
+    except Exception:
+        router.record(provider, time.time() - start, False)
+        raise
+    router.record(provider, time.time() - start, True)
+    return content
+
+async def _hedged_chat_async(providers, messages):
+    """Async _hedged_chat; the losing request is actually cancelled"""
+    pending = {asyncio.ensure_future(_post_chat_async(providers[0], messages))}
+    backups = list(providers[1:2])
+    delay = router.hedge_delay(providers[0])
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=delay if backups else None,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+            if backups:  # hedge delay elapsed or the primary failed
+                pending.add(asyncio.ensure_future(_post_chat_async(backups.pop(0), messages)))
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def call_core_async(messages, provider="grok", phase=None, hedge=False, run=None):
+    """Async call_core"""
+    if phase:  # compaction is CPU-bound; keep it off the event loop
+        messages, stats = await asyncio.to_thread(compact_messages, messages, phase)
+        compaction.record(run, stats)
+    providers = route(phase, provider, await get_providers_async()) if phase else [provider]
+    error = None
+    try:
+        if hedge and len(providers) > 1:
+            return await _hedged_chat_async(providers, messages)
+        for p in providers[:2]:
+            try:
+                return await _post_chat_async(p, messages)
+            except Exception as e:
+                error = e
+        raise error
+    except Exception as e:
+        return f"[System Error]: {e}"
+
+async def get_connection_stats_async():
+    """Async get_connection_stats"""
+    return await orchestrator_request("GET", "/v1/connections/stats")
+
+async def list_connections_async(library):
+    """List one connection library (api, webhook, mcp)"""
+    return await orchestrator_request("GET", f"/v1/connections/{library}")
+
+# Gradio only awaits real coroutine functions, so each button gets its own.
+async def list_api_connections_async():
+    return await list_connections_async("api")
+
+async def list_webhooks_async():
+    return await list_connections_async("webhook")
+
+async def list_mcp_servers_async():
+    return await list_connections_async("mcp")
+
+# Mutations only touch the local outbox, so the async wrappers never wait on the orchestrator.
+async def add_api_connection_async(conn_id, name, base_url, auth_type, api_key, models_str):
+    """Async add_api_connection"""
+    return add_api_connection(conn_id, name, base_url, auth_type, api_key, models_str)
+
+async def remove_api_connection_async(conn_id):
+    """Async remove_api_connection"""
+    return remove_api_connection(conn_id)
+
+async def add_webhook_async(webhook_id, name, url, method, events_str):
+    """Async add_webhook"""
+    return add_webhook(webhook_id, name, url, method, events_str)
+
+async def remove_webhook_async(webhook_id):
+    """Async remove_webhook"""
+    return remove_webhook(webhook_id)
+
+async def add_mcp_server_async(server_id, name, command, args_str):
+    """Async add_mcp_server"""
+    return add_mcp_server(server_id, name, command, args_str)
+
+async def remove_mcp_server_async(server_id):
+    """Async remove_mcp_server"""
+    return remove_mcp_server(server_id)
+
+async def parse_connection_from_voice_async(voice_input, connection_type):
+    """Async parse_connection_from_voice; its hedge cancels the losing request"""
+    try:
+        return parsed_connection(await call_core_async(voice_parser_messages(voice_input, connection_type),
+                                                       provider="grok", phase="parser", hedge=True))
+    except Exception as e:
+        return {"error": str(e)}
+
+async def voice_add_connection_async(voice_input, connection_type):
+    """Async voice_add_connection"""
+    if not (voice_input or "").strip():
+        return "Please provide voice input describing the connection to add."
+    parsed = await parse_connection_from_voice_async(voice_input, connection_type)
+    return confirmation_message(parsed, connection_type)[0]
+
+async def voice_add_api_async(voice_input):
+    return await voice_add_connection_async(voice_input, "api")
+
+async def voice_add_webhook_async(voice_input):
+    return await voice_add_connection_async(voice_input, "webhook")
+
+async def voice_add_mcp_async(voice_input):
+    return await voice_add_connection_async(voice_input, "mcp")
+
+VAULT_REPLY_WAIT = 15
+
+async def vault_reply_async(receipt, wait=VAULT_REPLY_WAIT):
+    """Wait briefly for a queued vault mutation to sync and return the vault's reply (shown once)"""
+    if not isinstance(receipt, dict) or "outbox_id" not in receipt:
+        return receipt
+    outbox, row_id, deadline = get_outbox(), receipt["outbox_id"], time.time() + wait
+    while True:
+        reply = outbox.take_reply(row_id)
+        if reply is not None:
+            return reply
+        status, error = outbox.row_status(row_id)
+        if status == "sent":  # may have landed since take_reply
+            return outbox.take_reply(row_id) or {**receipt, "status": "sent", "note": "Reply already shown or expired"}
+        if status == "failed":
+            return {**receipt, "status": "failed", "error": error}
+        if time.time() >= deadline:
+            return {**receipt, "status": status, "note": "Still syncing; press Check Result"}
+        await asyncio.sleep(0.25)
+
+# ===== SEAT ASSIGNMENT =====
+
+SEAT_COUNT = 5
+SEAT_BATCH = True  # cleared once the orchestrator shows it has no batch endpoint
+
+def seat_request(seat_id, task):
+    """Assign payload for one seat"""
+    return {"seat_id": int(seat_id), "task_description": task}
+
+async def _assign_batch(bodies):
+    """Batch assign; None if the call failed or the orchestrator has no batch endpoint"""
+    global SEAT_BATCH
+    try:
+        resp = await get_async_client().post("/v1/seats/assign/batch", json={"assignments": bodies}, timeout=10)
+        if resp.status_code in (404, 405, 501):
+            SEAT_BATCH = False  # don't pay for a doomed round trip on every later batch
+            return None
+        data = resp.json()
+    except Exception:
+        return None
+    results = data.get("assignments") if isinstance(data, dict) else None
+    return results if isinstance(results, list) and len(results) == len(bodies) else None
+
+async def assign_seats(tasks, seat_ids=None):
+    """Assign seats: one seat posts directly, several go as one batch with a concurrent fallback"""
+    started = time.time()
+    seat_ids = list(seat_ids if seat_ids is not None else range(len(tasks)))
+    pairs = [(int(sid), t.strip()) for sid, t in zip(seat_ids, tasks) if t and t.strip()]
+    if not pairs:
+        return {"error": "Provide at least one task description"}
+    extra = [sid for sid, _ in pairs if not 0 <= sid < SEAT_COUNT]
+    if extra:
+        return {"error": f"Only seats 0-{SEAT_COUNT - 1} exist; got tasks for seat(s) {', '.join(map(str, extra))}"}
+    bodies = [seat_request(sid, task) for sid, task in pairs]
+    
+    results = await _assign_batch(bodies) if len(bodies) > 1 and SEAT_BATCH else None
+    if results is not None:
+        mode = "batch"
+    else:
+        mode = "single" if len(bodies) == 1 else "concurrent"
+        results = await asyncio.gather(*(orchestrator_request("POST", "/v1/seats/assign", json=b) for b in bodies))
+    return {
+        "mode": mode,
+        "latency_ms": round((time.time() - started) * 1000, 1),
+        "assignments": list(results),
+    }
+
+# ===== CAMERA JOB QUEUE =====
+
+CAMERA_MAX_JOBS = int(os.getenv("CAMERA_MAX_JOBS", "2"))
+CAMERA_TIMEOUT = 300
+
+class CameraJobQueue:
+    """Vision jobs off the request path: capped concurrency, in-flight dedup and a (command, frame) result cache"""
+    def __init__(self, max_jobs=CAMERA_MAX_JOBS, keep=100, cache_size=64):
+        self.pool = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="genesis-camera")
+        self.jobs = OrderedDict()
+        self.inflight = {}  # (command, frame_hash) -> job_id
+        self.results = OrderedDict()  # (command, frame_hash) -> result, LRU
+        self.keep = keep
+        self.cache_size = cache_size
+        self.counts = {"submitted": 0, "cache_hits": 0, "deduplicated": 0}
+        self.lock = threading.Lock()
+
+    def submit(self, command, frame_path=None):
+        """Queue a camera command and return its job immediately"""
+        frame = None
+        if frame_path:
+            with open(frame_path, "rb") as f:
+                frame = f.read()
+        key = (command.strip().lower(), hashlib.sha256(frame).hexdigest() if frame else None)
+        with self.lock:
+            self.counts["submitted"] += 1
+            if key in self.inflight:
+                self.counts["deduplicated"] += 1
+                return self._snapshot(self.inflight[key])
+            job_id = uuid.uuid4().hex[:8]
+            job = {"id": job_id, "command": command, "frame_hash": key[1] and key[1][:12],
+                   "status": "queued", "submitted": time.time(), "started": None, "finished": None,
+                   "result": None, "cached": False}
+            self.jobs[job_id] = job
+            self._trim()
+            if key[1] and key in self.results:  # same command on the same frame: no reprocessing
+                self.results.move_to_end(key)
+                self.counts["cache_hits"] += 1
+                job.update(status="done", cached=True, result=self.results[key], started=job["submitted"], finished=time.time())
+            else:
+                self.inflight[key] = job_id
+                self.pool.submit(self._run, job, key, frame)
+            return self._snapshot(job_id)
+
+    def _run(self, job, key, frame):
+        with self.lock:
+            job.update(status="running", started=time.time())
+        try:
+            resp = requests.post(f"{ORCHESTRATOR}/v1/camera/process", params={"voice_input": job["command"]},
+                                 files={"frame": ("frame", frame)} if frame else None, timeout=CAMERA_TIMEOUT)
+            result = resp.json()
+            status = "failed" if resp.status_code >= 400 or "error" in result else "done"
+        except Exception as e:
+            result, status = {"error": str(e)}, "failed"
+        with self.lock:
+            job.update(status=status, result=result, finished=time.time())
+            self.inflight.pop(key, None)
+            if status == "done" and key[1]:
+                self.results[key] = result
+                while len(self.results) > self.cache_size:
+                    self.results.popitem(last=False)
+
+    def _trim(self):
+        while len(self.jobs) > self.keep:
+            oldest = next((j for j, job in self.jobs.items() if job["status"] in ("done", "failed")), None)
+            if oldest is None:
+                break
+            del self.jobs[oldest]
+
+    def _snapshot(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown job {job_id}"}
+        now = time.time()
+        snap = {k: v for k, v in job.items() if k not in ("submitted", "started", "finished")}
+        snap["elapsed_s"] = round((job["finished"] or now) - job["submitted"], 2)
+        if job["status"] == "queued":
+            snap["queue_position"] = [j["id"] for j in self.jobs.values() if j["status"] == "queued"].index(job_id) + 1
+        return snap
+
+    def status(self, job_id):
+        with self.lock:
+            return self._snapshot(job_id)
+
+    def stats(self):
+        with self.lock:
+            states = [j["status"] for j in self.jobs.values()]
+            return {**self.counts, **{s: states.count(s) for s in ("queued", "running", "done", "failed")},
+                    "max_concurrent": CAMERA_MAX_JOBS}
+
+    def recent(self, limit=10):
+        with self.lock:
+            return [self._snapshot(j) for j in list(self.jobs)[-limit:][::-1]]
+
+camera_jobs = CameraJobQueue()
+
+async def follow_camera_job(job_id, interval=0.5):
+    """Async generator streaming a job's progress until it finishes (holds no worker thread)"""
+    while True:
+        snap = camera_jobs.status(job_id)
+        yield snap, camera_jobs.recent()
+        if snap.get("status") not in ("queued", "running"):
+            return
+        await asyncio.sleep(interval)
+
+# ===== MODEL DISCOVERY CACHE =====
+
+DISCOVERY_TTL = float(os.getenv("DISCOVERY_TTL", "300"))
+SCAN_CURSOR_KEYS = ("cursor", "next_since", "scanned_at", "server_time")  # first one the server sends wins
+
+def model_key(model):
+    """Stable identifier for a discovered model entry"""
+    if isinstance(model, dict):
+        return str(model.get("id") or model.get("model_id") or model.get("name") or json.dumps(model, sort_keys=True))
+    return str(model)
+
+class DiscoveryCache:
+    """Last scan, pricing and optimal configs; scans after the first request only deltas"""
+    def __init__(self):
+        self.models = {}
+        self.scanned_at = None  # local clock, for freshness display and ordering
+        self.cursor = None  # `since` for the next delta scan, from the server when it provides one
+        self.cursor_source = None
+        self.last_scan = {}
+        self.pricing = None
+        self.pricing_at = None
+        self.optimal = {}  # task_type -> (version, fetched_at, result)
+        self.version = 0  # bumped whenever models or pricing change
+        self.lock = asyncio.Lock()
+
+    def _apply(self, data, full):
+        """Merge a scan response into the model table and return the diff"""
+        if isinstance(data, list):  # bare model list
+            data = {"models": data}
+        before = dict(self.models)
+        if isinstance(data.get("models"), list):
+            incoming = {model_key(m): m for m in data["models"]}
+            if full or data.get("full"):
+                self.models = incoming
+            else:
+                self.models.update(incoming)
+        for m in (data.get("added") or []) + (data.get("updated") or []):
+            self.models[model_key(m)] = m
+        for m in data.get("removed") or []:
+            self.models.pop(model_key(m), None)
+        diff = {
+            "added": sorted(k for k in self.models if k not in before),
+            "removed": sorted(k for k in before if k not in self.models),
+            "changed": sorted(k for k in self.models if k in before and self.models[k] != before[k]),
+        }
+        if any(diff.values()):
+            self.version += 1
+        return diff
+
+    # The lock guards cache reads and writes only; HTTP calls (a full scan can take
+    # up to 60s) run outside it so pricing/optimal lookups never queue behind a scan.
+
+    async def scan(self, full=False):
+        async with self.lock:
+            full = full or self.cursor is None
+            params = {"force": "true"} if full else {"since": self.cursor}
+        started = time.time()
+        data = await orchestrator_request("POST", "/v1/discovery/scan", timeout=60, params=params)
+        if not isinstance(data, (dict, list)):
+            return {"error": f"Unexpected scan response: {data!r}"[:200]}
+        if isinstance(data, dict) and "error" in data:
+            return data
+        async with self.lock:
+            stale = self.scanned_at is not None and self.scanned_at > started  # a newer scan already landed
+            diff = self._apply(data, full and not stale)
+            if not stale:
+                fields = data if isinstance(data, dict) else {}
+                server = next((fields[k] for k in SCAN_CURSOR_KEYS if fields.get(k) is not None), None)
+                self.cursor = server if server is not None else started  # local clock only as a fallback
+                self.cursor_source = "server" if server is not None else "local clock"
+            self.scanned_at = max(self.scanned_at or 0, started)
+            self.last_scan = {
+                "mode": "full" if full else "delta",
+                "cursor": self.cursor_source,
+                "elapsed_ms": round((time.time() - started) * 1000, 1),
+                "response_bytes": len(json.dumps(data)),
+                "models_total": len(self.models),
+            }
+            return {"diff": diff, "scan": self.last_scan, "response": data}
+
+    async def get_pricing(self, refresh=False):
+        async with self.lock:
+            if not (refresh or self.pricing is None or time.time() - self.pricing_at > DISCOVERY_TTL):
+                return self.pricing
+        data = await orchestrator_request("GET", "/v1/discovery/pricing")
+        if isinstance(data, dict) and "error" in data:
+            return data
+        async with self.lock:
+            if data != self.pricing:
+                self.version += 1
+            self.pricing, self.pricing_at = data, time.time()
+            return self.pricing
+
+    async def get_optimal(self, task_type):
+        """Memoized per task type until models or pricing change (or the TTL expires)"""
+        async with self.lock:
+            cached = self.optimal.get(task_type)
+            if cached and cached[0] == self.version and time.time() - cached[1] < DISCOVERY_TTL:
+                return {**cached[2], "cached": True}
+            version = self.version  # a change while the request is in flight leaves the entry stale
+        data = await orchestrator_request("GET", "/v1/discovery/optimal", params={"task_type": task_type})
+        if not isinstance(data, dict):
+            return {"error": f"Unexpected optimal-config response: {data!r}"[:200]}
+        if "error" not in data:
+            async with self.lock:
+                self.optimal[task_type] = (version, time.time(), data)
+        return data
+
+    def status_markdown(self, diff=None):
+        """Freshness, scan cost and highlighted model changes"""
+        age = lambda t: "never" if t is None else f"{time.time() - t:.0f}s ago"
+        lines = [f"**Last scan:** {age(self.scanned_at)}"]
+        if self.last_scan:
+            s = self.last_scan
+            lines[0] += f" ({s['mode']}, {s['elapsed_ms']} ms, {s['response_bytes']} bytes, {s['models_total']} models, {s['cursor']} cursor)"
+        lines.append(f"**Pricing:** {age(self.pricing_at)} · **Optimal configs cached:** {', '.join(self.optimal) or 'none'}")
+        if diff is not None:
+            if not any(diff.values()):
+                lines.append("No model changes since the last scan.")
+            for label, icon in (("added", "🟢"), ("removed", "🔴"), ("changed", "🟡")):
+                if diff[label]:
+                    lines.append(f"{icon} **{label.title()}:** " + ", ".join(f"`{k}`" for k in diff[label]))
+        return "\n\n".join(lines)
+
+discovery = DiscoveryCache()
+
 def launch():
+    get_outbox()  # resume draining anything left from a previous session
     with gr.Blocks(title="Vertex Genesis v1.4.0", theme=gr.themes.Monochrome()) as demo:
         gr.Markdown("# 🧬 Vertex Genesis v1.4.0 - Ghost Mode Evolution")
         
@@ -333,16 +1596,18 @@ def launch():
                 with gr.Row():
                     start_btn = gr.Button("🎯 Initialize Swarm", variant="primary")
                     mute_btn = gr.Button("🎤 Mute/Unmute Voice", variant="secondary")
+                    regenerate = gr.Checkbox(label="🔄 Regenerate (ignore cached build)", value=False)
                 
                 mute_status = gr.Textbox(label="Voice Status", value="🎤 ACTIVE", interactive=False)
                 log = gr.Textbox(label="Swarm Log", lines=15, max_lines=20)
                 
                 mic = gr.Audio(source="microphone", streaming=True, visible=False)
                 
-                start_btn.click(project_manager, inputs=[vision, provider_dropdown, log], outputs=log)
+                start_btn.click(project_manager, inputs=[vision, provider_dropdown, log, regenerate], outputs=log)
                 mute_btn.click(toggle_mute, outputs=mute_status)
-                refresh_providers.click(lambda: gr.Dropdown(choices=get_providers()), outputs=provider_dropdown)
-                mic.stream(listen_loop, mic, None)
+                refresh_providers.click(lambda: gr.Dropdown(choices=get_providers(refresh=True)), outputs=provider_dropdown)
+                interrupt_asr = gr.State()
+                mic.stream(listen_loop, [mic, interrupt_asr], interrupt_asr)
             
             # CONNECTIONS TAB (Universal Library Management)
             with gr.Tab("🔌 Connections"):
@@ -352,7 +1617,37 @@ def launch():
                 # Connection Stats
                 stats_btn = gr.Button("📊 View Connection Stats")
                 stats_out = gr.JSON(label="Connection Statistics")
-                stats_btn.click(get_connection_stats, outputs=stats_out)
+                stats_btn.click(get_connection_stats_async, outputs=stats_out)
+                
+                gr.Markdown("---")
+                
+                # Outbox (queued connection/vault mutations)
+                gr.Markdown("#### 📮 Pending Changes")
+                gr.Markdown("Adds/removes and vault entries are saved locally and synced to the orchestrator in the background; replies to recent connection changes appear under recently_sent for a few minutes (vault replies only on the Vault tab).")
+                with gr.Row():
+                    outbox_btn = gr.Button("📮 View Pending / Sent")
+                    outbox_retry_btn = gr.Button("🔁 Retry Failed", variant="secondary")
+                outbox_out = gr.JSON(label="Outbox")
+                outbox_btn.click(lambda: get_outbox().status(), outputs=outbox_out)
+                outbox_retry_btn.click(lambda: get_outbox().retry_failed(), outputs=outbox_out)
+                
+                gr.Markdown("---")
+                
+                # Streaming voice commands (finals feed the connection parser)
+                gr.Markdown("#### 🎙️ Speak a Connection Command")
+                with gr.Row():
+                    voice_stream_type = gr.Radio(["api", "webhook", "mcp"], value="api", label="Connection Type")
+                    voice_stream_mic = gr.Audio(source="microphone", streaming=True, label="Microphone")
+                with gr.Row():
+                    voice_stream_text = gr.Textbox(label="Live Transcript", interactive=False)
+                    voice_stream_latency = gr.Textbox(label="End-of-Utterance → Text Latency", interactive=False)
+                voice_stream_out = gr.Markdown()
+                voice_stream_final = gr.Textbox(visible=False)
+                command_asr = gr.State()
+                voice_stream_mic.stream(voice_command_stream, inputs=[voice_stream_mic, command_asr],
+                                        outputs=[voice_stream_text, voice_stream_latency, voice_stream_final, command_asr])
+                voice_stream_final.change(voice_add_connection_async, inputs=[voice_stream_final, voice_stream_type],
+                                          outputs=voice_stream_out)
                 
                 gr.Markdown("---")
                 
@@ -384,10 +1679,10 @@ def launch():
                         api_result = gr.JSON(label="Result")
                         list_api_btn = gr.Button("📋 List All API Connections")
                         
-                        voice_api_btn.click(lambda x: voice_add_connection(x, "api"), inputs=voice_api_input, outputs=voice_api_out)
-                        add_api_btn.click(add_api_connection, inputs=[api_conn_id, api_name, api_base_url, api_auth_type, api_key, api_models], outputs=api_result)
-                        remove_api_btn.click(remove_api_connection, inputs=remove_api_id, outputs=api_result)
-                        list_api_btn.click(lambda: requests.get(f"{ORCHESTRATOR}/v1/connections/api").json(), outputs=api_result)
+                        voice_api_btn.click(voice_add_api_async, inputs=voice_api_input, outputs=voice_api_out)
+                        add_api_btn.click(add_api_connection_async, inputs=[api_conn_id, api_name, api_base_url, api_auth_type, api_key, api_models], outputs=api_result)
+                        remove_api_btn.click(remove_api_connection_async, inputs=remove_api_id, outputs=api_result)
+                        list_api_btn.click(list_api_connections_async, outputs=api_result)
                     
                     # WEBHOOKS
                     with gr.Tab("🪝 Webhooks"):
@@ -414,10 +1709,10 @@ def launch():
                         wh_result = gr.JSON(label="Result")
                         list_wh_btn = gr.Button("📋 List All Webhooks")
                         
-                        voice_webhook_btn.click(lambda x: voice_add_connection(x, "webhook"), inputs=voice_webhook_input, outputs=voice_webhook_out)
-                        add_wh_btn.click(add_webhook, inputs=[wh_id, wh_name, wh_url, wh_method, wh_events], outputs=wh_result)
-                        remove_wh_btn.click(remove_webhook, inputs=remove_wh_id, outputs=wh_result)
-                        list_wh_btn.click(lambda: requests.get(f"{ORCHESTRATOR}/v1/connections/webhook").json(), outputs=wh_result)
+                        voice_webhook_btn.click(voice_add_webhook_async, inputs=voice_webhook_input, outputs=voice_webhook_out)
+                        add_wh_btn.click(add_webhook_async, inputs=[wh_id, wh_name, wh_url, wh_method, wh_events], outputs=wh_result)
+                        remove_wh_btn.click(remove_webhook_async, inputs=remove_wh_id, outputs=wh_result)
+                        list_wh_btn.click(list_webhooks_async, outputs=wh_result)
                     
                     # MCP SERVERS
                     with gr.Tab("🔧 MCP Servers"):
@@ -443,10 +1738,10 @@ def launch():
                         mcp_result = gr.JSON(label="Result")
                         list_mcp_btn = gr.Button("📋 List All MCP Servers")
                         
-                        voice_mcp_btn.click(lambda x: voice_add_connection(x, "mcp"), inputs=voice_mcp_input, outputs=voice_mcp_out)
-                        add_mcp_btn.click(add_mcp_server, inputs=[mcp_id, mcp_name, mcp_cmd, mcp_args], outputs=mcp_result)
-                        remove_mcp_btn.click(remove_mcp_server, inputs=remove_mcp_id, outputs=mcp_result)
-                        list_mcp_btn.click(lambda: requests.get(f"{ORCHESTRATOR}/v1/connections/mcp").json(), outputs=mcp_result)
+                        voice_mcp_btn.click(voice_add_mcp_async, inputs=voice_mcp_input, outputs=voice_mcp_out)
+                        add_mcp_btn.click(add_mcp_server_async, inputs=[mcp_id, mcp_name, mcp_cmd, mcp_args], outputs=mcp_result)
+                        remove_mcp_btn.click(remove_mcp_server_async, inputs=remove_mcp_id, outputs=mcp_result)
+                        list_mcp_btn.click(list_mcp_servers_async, outputs=mcp_result)
             
             # VAULT TAB (Vaultwarden & 2FA)
             with gr.Tab("🔐 Vault"):
@@ -461,12 +1756,8 @@ def launch():
                 vault_auth_btn = gr.Button("🔐 Authenticate", variant="primary")
                 vault_auth_out = gr.JSON(label="Auth Status")
                 
-                def vault_auth(email, password):
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/vault/auth", json={"email": email, "master_password": password})
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
+                async def vault_auth(email, password):
+                    return await orchestrator_request("POST", "/v1/vault/auth", json={"email": email, "master_password": password})
                 
                 vault_auth_btn.click(vault_auth, inputs=[vault_email, vault_password], outputs=vault_auth_out)
                 
@@ -483,24 +1774,14 @@ def launch():
                 cipher_notes = gr.Textbox(label="Notes (optional)", placeholder="Additional information...")
                 cipher_auto_gen = gr.Checkbox(label="Auto-generate password", value=True)
                 
-                create_cipher_btn = gr.Button("💾 Save to Vault", variant="primary")
-                cipher_result = gr.JSON(label="Result")
-                
-                def create_cipher(name, username, password, uri, notes, auto_gen):
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/vault/cipher", json={
-                            "name": name,
-                            "username": username,
-                            "password": password if password else None,
-                            "uri": uri if uri else None,
-                            "notes": notes if notes else None,
-                            "auto_generate_password": auto_gen
-                        })
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                create_cipher_btn.click(create_cipher, inputs=[cipher_name, cipher_username, cipher_password, cipher_uri, cipher_notes, cipher_auto_gen], outputs=cipher_result)
+                with gr.Row():
+                    create_cipher_btn = gr.Button("💾 Save to Vault", variant="primary")
+                    cipher_check_btn = gr.Button("🔄 Check Result", variant="secondary")
+                cipher_result = gr.JSON(label="Result (generated passwords are shown once and not stored)")
+                
+                create_cipher_btn.click(create_cipher, inputs=[cipher_name, cipher_username, cipher_password, cipher_uri, cipher_notes, cipher_auto_gen], outputs=cipher_result).then(
+                    vault_reply_async, inputs=cipher_result, outputs=cipher_result)
+                cipher_check_btn.click(vault_reply_async, inputs=cipher_result, outputs=cipher_result)
                 
                 gr.Markdown("---")
                 
@@ -512,12 +1793,10 @@ def launch():
                 gen_pwd_btn = gr.Button("🔑 Generate Password", variant="secondary")
                 pwd_out = gr.Textbox(label="Generated Password", interactive=False)
                 
-                def gen_password(length, symbols):
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/vault/generate-password?length={int(length)}&include_symbols={symbols}")
-                        return resp.json().get("password", "")
-                    except Exception as e:
-                        return f"Error: {e}"
+                async def gen_password(length, symbols):
+                    data = await orchestrator_request("POST", "/v1/vault/generate-password",
+                                                      params={"length": int(length), "include_symbols": symbols})
+                    return f"Error: {data['error']}" if "error" in data else data.get("password", "")
                 
                 gen_pwd_btn.click(gen_password, inputs=[pwd_length, pwd_symbols], outputs=pwd_out)
                 
@@ -533,12 +1812,9 @@ def launch():
                 gen_2fa_btn = gr.Button("🔐 Generate 2FA Secret", variant="secondary")
                 totp_out = gr.JSON(label="2FA Details")
                 
-                def gen_2fa(account, issuer):
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/vault/generate-2fa?account_name={account}&issuer={issuer}")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
+                async def gen_2fa(account, issuer):
+                    return await orchestrator_request("POST", "/v1/vault/generate-2fa",
+                                                      params={"account_name": account, "issuer": issuer})
                 
                 gen_2fa_btn.click(gen_2fa, inputs=[totp_account, totp_issuer], outputs=totp_out)
                 
@@ -553,19 +1829,11 @@ def launch():
                 
                 ciphers_out = gr.JSON(label="Credentials")
                 
-                def list_ciphers():
-                    try:
-                        resp = requests.get(f"{ORCHESTRATOR}/v1/vault/ciphers")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
+                async def list_ciphers():
+                    return await orchestrator_request("GET", "/v1/vault/ciphers")
                 
-                def search_ciphers(query):
-                    try:
-                        resp = requests.get(f"{ORCHESTRATOR}/v1/vault/search?q={query}")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
+                async def search_ciphers(query):
+                    return await orchestrator_request("GET", "/v1/vault/search", params={"q": query})
                 
                 list_ciphers_btn.click(list_ciphers, outputs=ciphers_out)
                 search_btn.click(search_ciphers, inputs=search_query, outputs=ciphers_out)
@@ -594,6 +1862,10 @@ def launch():
                 health_btn = gr.Button("🏥 Check System Health")
                 health_out = gr.JSON(label="Health Status")
                 health_btn.click(lambda: requests.get(f"{ORCHESTRATOR}/health").json(), outputs=health_out)
+
+                router_btn = gr.Button("🧭 Provider Routing Stats")
+                router_out = gr.JSON(label="Observed Provider Latency / Errors")
+                router_btn.click(router.snapshot, outputs=router_out)
             
             # GHOST MODE TAB
             with gr.Tab("👻 Ghost Mode"):
@@ -610,26 +1882,16 @@ def launch():
                         ghost_status_out = gr.JSON(label="Ghost Mode Status")
                         ghost_message_out = gr.Textbox(label="Message", interactive=False)
                         
-                        def activate_ghost():
-                            try:
-                                resp = requests.post(f"{ORCHESTRATOR}/v1/ghost/activate")
-                                return resp.json(), resp.json().get("message", "Activated")
-                            except Exception as e:
-                                return {"error": str(e)}, f"Error: {e}"
+                        async def activate_ghost():
+                            data = await orchestrator_request("POST", "/v1/ghost/activate")
+                            return data, f"Error: {data['error']}" if "error" in data else data.get("message", "Activated")
                         
-                        def deactivate_ghost():
-                            try:
-                                resp = requests.post(f"{ORCHESTRATOR}/v1/ghost/deactivate")
-                                return resp.json(), resp.json().get("message", "Deactivated")
-                            except Exception as e:
-                                return {"error": str(e)}, f"Error: {e}"
+                        async def deactivate_ghost():
+                            data = await orchestrator_request("POST", "/v1/ghost/deactivate")
+                            return data, f"Error: {data['error']}" if "error" in data else data.get("message", "Deactivated")
                         
-                        def get_ghost_status():
-                            try:
-                                resp = requests.get(f"{ORCHESTRATOR}/v1/ghost/status")
-                                return resp.json()
-                            except Exception as e:
-                                return {"error": str(e)}
+                        async def get_ghost_status():
+                            return await orchestrator_request("GET", "/v1/ghost/status")
                         
                         ghost_activate_btn.click(activate_ghost, outputs=[ghost_status_out, ghost_message_out])
                         ghost_deactivate_btn.click(deactivate_ghost, outputs=[ghost_status_out, ghost_message_out])
@@ -642,28 +1904,24 @@ def launch():
                         seat_id_input = gr.Slider(0, 4, step=1, value=0, label="Seat ID")
                         task_desc_input = gr.Textbox(label="Task Description", placeholder="e.g., build async parser in Rust")
                         seat_assign_btn = gr.Button("🪑 Assign Model to Seat")
+                        seat_tasks_input = gr.Textbox(label="All Seats (one task per line, seats 0–4)", lines=5,
+                                                      placeholder="build async parser in Rust\nwrite React UI\n...")
+                        seat_assign_all_btn = gr.Button("🪑 Assign All Seats", variant="primary")
                         seat_status_btn = gr.Button("📊 View All Seats")
                         
                         seat_result_out = gr.JSON(label="Assignment Result")
                         
-                        def assign_seat(seat_id, task_desc):
-                            try:
-                                resp = requests.post(f"{ORCHESTRATOR}/v1/seats/assign", json={
-                                    "seat_id": int(seat_id),
-                                    "task_description": task_desc
-                                })
-                                return resp.json()
-                            except Exception as e:
-                                return {"error": str(e)}
+                        async def assign_seat(seat_id, task_desc):
+                            return await assign_seats([task_desc], [seat_id])
+                        
+                        async def assign_all_seats(tasks_text):
+                            return await assign_seats((tasks_text or "").splitlines())
                         
-                        def get_seats_status():
-                            try:
-                                resp = requests.get(f"{ORCHESTRATOR}/v1/seats/status")
-                                return resp.json()
-                            except Exception as e:
-                                return {"error": str(e)}
+                        async def get_seats_status():
+                            return await orchestrator_request("GET", "/v1/seats/status")
                         
                         seat_assign_btn.click(assign_seat, inputs=[seat_id_input, task_desc_input], outputs=seat_result_out)
+                        seat_assign_all_btn.click(assign_all_seats, inputs=seat_tasks_input, outputs=seat_result_out)
                         seat_status_btn.click(get_seats_status, outputs=seat_result_out)
                 
                 gr.Markdown("---")
@@ -674,33 +1932,25 @@ def launch():
                     discovery_pricing_btn = gr.Button("💰 Check Pricing")
                     discovery_optimal_btn = gr.Button("✨ Get Optimal Config")
                 
-                task_type_input = gr.Dropdown(["general", "code", "vision"], value="general", label="Task Type")
+                with gr.Row():
+                    task_type_input = gr.Dropdown(["general", "code", "vision"], value="general", label="Task Type")
+                    full_rescan_input = gr.Checkbox(label="Full rescan (detects removed models)", value=False)
+                discovery_status = gr.Markdown(discovery.status_markdown())
                 discovery_out = gr.JSON(label="Discovery Results")
                 
-                def scan_models():
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/discovery/scan?force=true")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                def get_pricing():
-                    try:
-                        resp = requests.get(f"{ORCHESTRATOR}/v1/discovery/pricing")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                def get_optimal(task_type):
-                    try:
-                        resp = requests.get(f"{ORCHESTRATOR}/v1/discovery/optimal?task_type={task_type}")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                discovery_scan_btn.click(scan_models, outputs=discovery_out)
-                discovery_pricing_btn.click(get_pricing, outputs=discovery_out)
-                discovery_optimal_btn.click(get_optimal, inputs=task_type_input, outputs=discovery_out)
+                async def scan_models(full):
+                    result = await discovery.scan(full=full)
+                    return result, discovery.status_markdown(result.get("diff"))
+                
+                async def get_discovery_pricing():
+                    return await discovery.get_pricing(), discovery.status_markdown()
+                
+                async def get_optimal(task_type):
+                    return await discovery.get_optimal(task_type), discovery.status_markdown()
+                
+                discovery_scan_btn.click(scan_models, inputs=full_rescan_input, outputs=[discovery_out, discovery_status])
+                discovery_pricing_btn.click(get_discovery_pricing, outputs=[discovery_out, discovery_status])
+                discovery_optimal_btn.click(get_optimal, inputs=task_type_input, outputs=[discovery_out, discovery_status])
             
             # COST DASHBOARD TAB
             with gr.Tab("💰 Cost Dashboard"):
@@ -713,52 +1963,42 @@ def launch():
                 
                 cost_stats_out = gr.JSON(label="Cost Statistics")
                 cost_suggestions_out = gr.JSON(label="Optimization Suggestions")
+                studio_savings_out = gr.JSON(label="Studio-Side Savings (tokens per run; latency figures are estimates)")
+                
+                async def get_cost_stats():
+                    return await orchestrator_request("GET", "/v1/cost/statistics")
+                
+                async def get_cost_suggestions():
+                    return await orchestrator_request("GET", "/v1/cost/suggestions")
                 
-                def get_cost_stats():
-                    try:
-                        resp = requests.get(f"{ORCHESTRATOR}/v1/cost/statistics")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                def get_cost_suggestions():
-                    try:
-                        resp = requests.get(f"{ORCHESTRATOR}/v1/cost/suggestions")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                def reset_cost_stats():
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/cost/reset")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
-                
-                def refresh_all_cost():
-                    stats = get_cost_stats()
-                    suggestions = get_cost_suggestions()
-                    return stats, suggestions
-                
-                refresh_cost_btn.click(refresh_all_cost, outputs=[cost_stats_out, cost_suggestions_out])
+                async def reset_cost_stats():
+                    return await orchestrator_request("POST", "/v1/cost/reset")
+                
+                async def refresh_all_cost():
+                    stats, suggestions = await asyncio.gather(get_cost_stats(), get_cost_suggestions())
+                    return stats, suggestions, studio_savings()
+                
+                refresh_cost_btn.click(refresh_all_cost, outputs=[cost_stats_out, cost_suggestions_out, studio_savings_out])
                 reset_cost_btn.click(reset_cost_stats, outputs=cost_stats_out)
                 
                 gr.Markdown("---")
                 gr.Markdown("### 📷 Visual Project Inputs")
                 gr.Markdown("Use camera for visual inputs (OCR, translation, object identification).")
                 
-                camera_input = gr.Textbox(label="Voice Command", placeholder="e.g., 'translate this french text' or 'read this code'")
+                with gr.Row():
+                    camera_input = gr.Textbox(label="Voice Command", placeholder="e.g., 'translate this french text' or 'read this code'")
+                    camera_frame = gr.Image(label="Frame (optional — repeated commands on the same frame are served from cache)", type="filepath")
                 camera_btn = gr.Button("📷 Process Camera Command")
-                camera_out = gr.JSON(label="Camera Result")
+                camera_job_id = gr.State()
+                camera_out = gr.JSON(label="Camera Job")
+                camera_jobs_out = gr.JSON(label="Recent Camera Jobs")
                 
-                def process_camera(voice_input):
-                    try:
-                        resp = requests.post(f"{ORCHESTRATOR}/v1/camera/process?voice_input={voice_input}")
-                        return resp.json()
-                    except Exception as e:
-                        return {"error": str(e)}
+                def process_camera(voice_input, frame_path):
+                    job = camera_jobs.submit(voice_input, frame_path)
+                    return job.get("id"), job
                 
-                camera_btn.click(process_camera, inputs=camera_input, outputs=camera_out)
+                camera_btn.click(process_camera, inputs=[camera_input, camera_frame], outputs=[camera_job_id, camera_out]).then(
+                    follow_camera_job, inputs=camera_job_id, outputs=[camera_out, camera_jobs_out])
             
             # ABOUT TAB
             with gr.Tab("ℹ️ About"):
@@ -0,0 +1,147 @@
+"""Load test: thread-based vs asyncio orchestrator path.
+
+Runs N concurrent "sessions" against the orchestrator (or a built-in mock
+with artificial latency) using the sync `requests` handlers on a thread
+pool, then the async `httpx` handlers on one event loop, and reports wall
+time, per-request latency and peak thread count for each.
+
+Scenarios:
+    stats  GET /v1/connections/stats (get_connection_stats / _async)
+    chat   routed Engineer-phase chat completion (call_core / call_core_async),
+           the long-running handler behind project creation
+
+    python studio/load_test.py --sessions 300 --mock-delay 0.5
+    python studio/load_test.py --scenario chat --sessions 200 --mock-delay 5
+    python studio/load_test.py --sessions 100   # against ORCHESTRATOR_URL
+"""
+import argparse, asyncio, json, os, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHAT_MESSAGES = [
+    {"role": "system", "content": "You are the Engineer."},
+    {"role": "user", "content": "Implement the design:\n\n## Files\n- src/app.py: entry point\n- src/api.py: routes"},
+]
+
+def start_mock(delay):
+    """Serve stats, providers and chat completions with a fixed delay on a random port"""
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.startswith("/v1/providers"):
+                return self._reply({"providers": ["grok", "anthropic", "local"]})
+            time.sleep(delay)
+            self._reply({"total": 0})
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(delay)
+            self._reply({"content": "def main():\n    pass\n"})
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+class ThreadSampler:
+    """Samples the studio's thread count in the background while a run is in progress"""
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = 0
+        self.stop = threading.Event()
+
+    def count(self):
+        # the in-process mock's per-request threads are not the studio's
+        return sum(1 for t in threading.enumerate()
+                   if "process_request_thread" not in t.name and t is not self.thread)
+
+    def _run(self):
+        while not self.stop.is_set():
+            self.peak = max(self.peak, self.count())
+            self.stop.wait(self.interval)
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.thread.join()
+
+def summarize(name, wall, latencies, peak_threads, errors):
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+    print(f"{name:<8} wall={wall:6.2f}s  p50={pct(50):.3f}s  p95={pct(95):.3f}s  "
+          f"peak_threads={peak_threads:<4} errors={errors}")
+
+def failed(result):
+    return "error" in result if isinstance(result, dict) else str(result).startswith("[System Error]")
+
+def run_threads(studio, scenario, sessions, workers):
+    handler = {
+        "stats": studio.get_connection_stats,
+        "chat": lambda: studio.call_core(CHAT_MESSAGES, provider="grok", phase="engineer"),
+    }[scenario]
+    latencies, errors = [], 0
+
+    def one(submitted):
+        result = handler()
+        return time.time() - submitted, failed(result)  # includes time queued for a worker
+
+    start = time.time()
+    with ThreadSampler() as sampler, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(one, time.time()) for _ in range(sessions)]
+        results = [f.result() for f in futures]
+    for latency, bad in results:
+        latencies.append(latency)
+        errors += bad
+    summarize("threads", time.time() - start, latencies, sampler.peak, errors)
+
+async def run_async(studio, scenario, sessions):
+    handler = {
+        "stats": studio.get_connection_stats_async,
+        "chat": lambda: studio.call_core_async(CHAT_MESSAGES, provider="grok", phase="engineer"),
+    }[scenario]
+
+    async def one():
+        start = time.time()
+        result = await handler()
+        return time.time() - start, failed(result)
+
+    start = time.time()
+    with ThreadSampler() as sampler:
+        results = await asyncio.gather(*(one() for _ in range(sessions)))
+    await studio.close_async_client()
+    summarize("asyncio", time.time() - start, [r[0] for r in results], sampler.peak, sum(r[1] for r in results))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=["stats", "chat"], default="stats")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=40, help="thread pool size (Gradio's default is 40)")
+    parser.add_argument("--mock-delay", type=float, default=None, help="serve a local mock with this latency")
+    args = parser.parse_args()
+
+    if args.mock_delay is not None:
+        os.environ["ORCHESTRATOR_URL"] = start_mock(args.mock_delay)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import genesis_studio as studio
+
+    print(f"[INFO] {args.sessions} {args.scenario} sessions against {studio.ORCHESTRATOR}")
+    run_threads(studio, args.scenario, args.sessions, args.workers)
+    asyncio.run(run_async(studio, args.scenario, args.sessions))
+
+if __name__ == "__main__":
+    main()